@@ -6,9 +6,16 @@ Based on the correct format interpretation from external software.
 Uses the actual .100 format structure: 4-byte commands with simple coordinate encoding.
 """
 
-from typing import BinaryIO, List, Tuple
+import os
+import mmap
+import hashlib
+from typing import List, Tuple
 from enum import Enum
 from dataclasses import dataclass
+from itertools import accumulate, chain, compress, repeat
+from array import array
+from operator import attrgetter, sub
+from math import hypot
 
 
 class CommandType(Enum):
@@ -21,7 +28,17 @@ class CommandType(Enum):
     PATTERN_END = "PATTERN_END"  # 0x1F terminator
 
 
-@dataclass
+# Module-level aliases so hot paths skip the class attribute lookup
+_STITCH = CommandType.STITCH
+_MOVE = CommandType.MOVE
+_COLOR_CHANGE = CommandType.COLOR_CHANGE
+_END = CommandType.END
+
+# Enum.value is a descriptor lookup; bulk formatting reads the names from a dict
+_COMMAND_NAMES = {command_type: command_type.value for command_type in CommandType}
+
+
+@dataclass(slots=True)
 class PatternCommand:
     """Represents a single pattern command."""
     command_type: CommandType
@@ -30,6 +47,131 @@ class PatternCommand:
     raw_bytes: bytes = None
 
 
+# Coordinate byte -> delta (0x80 bit indicates negative, Y is negated in the format)
+_X_DELTAS = tuple(-(b - 0x80) if b > 0x80 else b for b in range(256))
+_Y_DELTAS = tuple(-d for d in _X_DELTAS)
+
+
+_get_type = attrgetter('command_type')
+_get_x = attrgetter('x')
+_get_y = attrgetter('y')
+_get_raw_bytes = attrgetter('raw_bytes')
+
+
+def _stitch_line_points(start_x: int, start_y: int, end_x: int, end_y: int,
+                        stitch_spacing: float, skip_first: bool = False) -> Tuple[list, list]:
+    """Get the coordinates of evenly distributed stitches between two points.
+
+    Stitch i lies at t = i / (num_stitches - 1) along the line, truncated to
+    integers. A zero-length line is a single point, which is dropped if
+    skip_first is set.
+    """
+    dx = end_x - start_x
+    dy = end_y - start_y
+
+    if dx == 0 and dy == 0:
+        return ([], []) if skip_first else ([start_x], [start_y])
+
+    # Calculate number of stitches needed from the line length
+    num_stitches = max(2, int(hypot(dx, dy) / stitch_spacing) + 1)
+    last = num_stitches - 1
+    xs = []
+    ys = []
+    for i in range(1 if skip_first else 0, num_stitches):
+        t = i / last
+        xs.append(int(start_x + t * dx))
+        ys.append(int(start_y + t * dy))
+    return xs, ys
+
+
+def _rectangle_commands(center_x: int, center_y: int, width: int, height: int,
+                        stitch_spacing: float) -> List[PatternCommand]:
+    """Build the move and stitched outline commands for a rectangle."""
+    half_w = width // 2
+    half_h = height // 2
+
+    # Calculate corner positions
+    corners = [
+        (center_x - half_w, center_y - half_h),  # Top-left
+        (center_x + half_w, center_y - half_h),  # Top-right
+        (center_x + half_w, center_y + half_h),  # Bottom-right
+        (center_x - half_w, center_y + half_h),  # Bottom-left
+    ]
+
+    # Move to start position
+    commands = [PatternCommand(_MOVE, corners[0][0], corners[0][1])]
+
+    # Create stitched outline
+    for i in range(len(corners)):
+        start_corner = corners[i]
+        end_corner = corners[(i + 1) % len(corners)]
+
+        # Skip the first point of each side after the first to avoid duplicates
+        xs, ys = _stitch_line_points(start_corner[0], start_corner[1],
+                                     end_corner[0], end_corner[1],
+                                     stitch_spacing, skip_first=i > 0)
+        commands.extend(map(PatternCommand, repeat(_STITCH), xs, ys))
+
+    return commands
+
+
+def _command_type(cmd_byte: int) -> CommandType:
+    """Determine the command type from the first byte of a record."""
+    if cmd_byte == 0x61:
+        return CommandType.STITCH
+    elif cmd_byte == 0x1F:
+        return CommandType.PATTERN_END  # Pattern end command (terminator)
+    elif cmd_byte == 0x03:
+        return CommandType.BACKTACK  # Backtack moves (rapid moves for thread securing)
+    elif cmd_byte & 0x01:
+        return CommandType.MOVE  # Any odd-numbered command except 0x61 and 0x03
+    else:
+        return CommandType.COLOR_CHANGE  # Even-numbered commands
+
+
+# Signed delta -> coordinate byte; negative deltas index from the end, so
+# _DELTA_BYTES[-d] == d | 0x80 for d in 1..127
+_DELTA_BYTES = tuple(d if d <= 0x80 else (256 - d) | 0x80 for d in range(256))
+
+# CommandType -> command byte used when generating records
+_COMMAND_BYTES = {
+    CommandType.STITCH: 0x61,
+    CommandType.MOVE: 0x01,  # Use odd number for move
+    CommandType.COLOR_CHANGE: 0x02,  # Use even number for color change
+    CommandType.BACKTACK: 0x03,  # Backtack moves
+    CommandType.PATTERN_END: 0x1F  # Pattern terminator
+}
+
+# Command byte -> CommandType lookup table, so decoding needs no branching
+_COMMAND_TYPES = tuple(_command_type(b) for b in range(256))
+
+
+def _decode_100_records(data: bytes, start_x: int = 0, start_y: int = 0) -> Tuple[list, array, array, list]:
+    """Decode .100 records into parallel command type, X, Y and raw bytes columns.
+
+    The data is decoded column-wise: every 4th byte starting at offsets 0, 2
+    and 3 gives the command bytes, the X deltas and the Y deltas respectively.
+    Decoding stops after the first pattern end command (terminator).
+    """
+    size = len(data) - len(data) % 4  # Ignore a trailing partial record
+
+    cmd_bytes = data[0:size:4]
+    end = cmd_bytes.find(0x1F)
+    if end != -1:
+        cmd_bytes = cmd_bytes[:end + 1]
+        size = len(cmd_bytes) * 4
+
+    # Running sums of the deltas give the absolute positions
+    xs = array('i', accumulate(map(_X_DELTAS.__getitem__, data[2:size:4]), initial=start_x))
+    ys = array('i', accumulate(map(_Y_DELTAS.__getitem__, data[3:size:4]), initial=start_y))
+    del xs[0], ys[0]
+
+    types = list(map(_COMMAND_TYPES.__getitem__, cmd_bytes))
+    raws = [data[i:i + 4] for i in range(0, size, 4)]
+
+    return types, xs, ys, raws
+
+
 class Mitsubishi100Parser:
     """Parser for Mitsubishi .100 format pattern files."""
 
@@ -37,6 +179,8 @@ class Mitsubishi100Parser:
         self.commands = []
         self.current_x = 0
         self.current_y = 0
+        self._last_save_x = 0  # Position the next generated record's delta is relative to
+        self._last_save_y = 0
 
     def parse_file(self, filename: str) -> List[PatternCommand]:
         """Parse a .100 format file and return list of commands."""
@@ -45,90 +189,23 @@ class Mitsubishi100Parser:
         self.current_y = 0
 
         with open(filename, 'rb') as f:
-            self._read_100_stitches(f)
+            if os.fstat(f.fileno()).st_size:
+                # Map the file instead of copying it into a bytes object
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    self._read_100_stitches(data)
+            else:
+                self._read_100_stitches(b'')  # Empty files cannot be mapped
 
         return self.commands
 
-    def _read_100_stitches(self, f: BinaryIO):
-        """Read stitches from .100 format file."""
-        count = 0
-
-        while True:
-            count += 1
-            b = bytearray(f.read(4))
-            if len(b) != 4:
-                break
-
-            # Extract coordinates (bytes 2 and 3)
-            x = b[2]
-            y = b[3]
-
-            # Handle sign encoding (0x80 bit indicates negative)
-            if x > 0x80:
-                x -= 0x80
-                x = -x
-            if y > 0x80:
-                y -= 0x80
-                y = -y
-
-            # Y coordinate is negated in the format
-            y = -y
-
-            # Update absolute position
-            self.current_x += x
-            self.current_y += y
-
-            # Determine command type based on first byte
-            if b[0] == 0x61:
-                # Stitch command
-                cmd = PatternCommand(
-                    command_type=CommandType.STITCH,
-                    x=self.current_x,
-                    y=self.current_y,
-                    raw_bytes=bytes(b)
-                )
-                self.commands.append(cmd)
-
-            elif b[0] == 0x1F:
-                # Pattern end command (terminator)
-                cmd = PatternCommand(
-                    command_type=CommandType.PATTERN_END,
-                    x=self.current_x,
-                    y=self.current_y,
-                    raw_bytes=bytes(b)
-                )
-                self.commands.append(cmd)
-                break  # End of pattern
+    def _read_100_stitches(self, data: bytes):
+        """Read stitches from the contents of a .100 format file."""
+        types, xs, ys, raws = _decode_100_records(data, self.current_x, self.current_y)
+        if xs:
+            self.current_x = xs[-1]
+            self.current_y = ys[-1]
 
-            elif b[0] == 0x03:
-                # Backtack moves (rapid moves for thread securing)
-                cmd = PatternCommand(
-                    command_type=CommandType.BACKTACK,
-                    x=self.current_x,
-                    y=self.current_y,
-                    raw_bytes=bytes(b)
-                )
-                self.commands.append(cmd)
-
-            elif (b[0] & 0x01) != 0:
-                # Move command (any odd-numbered command except 0x61 and 0x03)
-                cmd = PatternCommand(
-                    command_type=CommandType.MOVE,
-                    x=self.current_x,
-                    y=self.current_y,
-                    raw_bytes=bytes(b)
-                )
-                self.commands.append(cmd)
-
-            else:
-                # Color change (even-numbered commands except 0x61)
-                cmd = PatternCommand(
-                    command_type=CommandType.COLOR_CHANGE,
-                    x=self.current_x,
-                    y=self.current_y,
-                    raw_bytes=bytes(b)
-                )
-                self.commands.append(cmd)
+        self.commands.extend(map(PatternCommand, types, xs, ys, raws))
 
         # Add end command
         end_cmd = PatternCommand(command_type=CommandType.END)
@@ -136,122 +213,100 @@ class Mitsubishi100Parser:
 
     def get_pattern_bounds(self) -> Tuple[int, int, int, int]:
         """Get the bounding box of the pattern (min_x, min_y, max_x, max_y)."""
-        if not self.commands:
-            return (0, 0, 0, 0)
-
-        coords = [(cmd.x, cmd.y) for cmd in self.commands
-                 if cmd.command_type in [CommandType.STITCH, CommandType.MOVE]]
+        drawn = self._commands_of_type(_STITCH, _MOVE)
 
-        if not coords:
+        if not drawn:
             return (0, 0, 0, 0)
 
-        x_coords = [x for x, y in coords]
-        y_coords = [y for x, y in coords]
+        x_coords = array('i', map(_get_x, drawn))
+        y_coords = array('i', map(_get_y, drawn))
 
         return (min(x_coords), min(y_coords), max(x_coords), max(y_coords))
 
+    def _commands_of_type(self, *command_types: CommandType) -> List[PatternCommand]:
+        """Get all commands of the given types, in pattern order."""
+        mask = map(command_types.__contains__, map(_get_type, self.commands))
+        return list(compress(self.commands, mask))
+
     def get_pattern_stats(self) -> dict:
-        """Get statistics about the pattern."""
+        """Get statistics about the pattern.
+
+        The path length is the distance travelled between consecutive
+        stitch/move positions; the travel from the origin to the first
+        position is not counted.
+        """
+        types = list(map(_get_type, self.commands))
+        drawn = self._commands_of_type(_STITCH, _MOVE)
+        xs = array('i', map(_get_x, drawn))
+        ys = array('i', map(_get_y, drawn))
+
         stats = {
             'total_commands': len(self.commands),
-            'stitch_count': 0,
-            'move_count': 0,
-            'color_changes': 0,
-            'path_length': 0.0
+            'stitch_count': types.count(_STITCH),
+            'move_count': types.count(_MOVE),
+            'color_changes': types.count(_COLOR_CHANGE),
+            'path_length': float(sum(map(hypot, map(sub, xs[1:], xs), map(sub, ys[1:], ys))))
         }
 
-        last_x, last_y = 0, 0
-
-        for cmd in self.commands:
-            if cmd.command_type == CommandType.STITCH:
-                stats['stitch_count'] += 1
-                if last_x != 0 or last_y != 0:
-                    dx = cmd.x - last_x
-                    dy = cmd.y - last_y
-                    stats['path_length'] += (dx*dx + dy*dy) ** 0.5
-                last_x, last_y = cmd.x, cmd.y
-
-            elif cmd.command_type == CommandType.MOVE:
-                stats['move_count'] += 1
-                if last_x != 0 or last_y != 0:
-                    dx = cmd.x - last_x
-                    dy = cmd.y - last_y
-                    stats['path_length'] += (dx*dx + dy*dy) ** 0.5
-                last_x, last_y = cmd.x, cmd.y
-
-            elif cmd.command_type == CommandType.COLOR_CHANGE:
-                stats['color_changes'] += 1
-
         return stats
 
     def save_to_file(self, filename: str):
         """Save pattern to .100 format file."""
+        # Generated records are encoded relative to the origin at file start
+        self._last_save_x = 0
+        self._last_save_y = 0
+
+        records = list(map(_get_raw_bytes, self.commands))
+        has_raw = bytes(map(bool, records))
+
+        # Raw bytes are written as-is; each run of commands without them is
+        # generated in one batch
+        parts = []
+        start = 0
+        while start < len(records):
+            raw = has_raw[start]
+            stop = has_raw.find(0 if raw else 1, start)
+            if stop == -1:
+                stop = len(records)
+            if raw:
+                parts.extend(records[start:stop])
+            else:
+                parts.append(self._generate_raw_records(self.commands[start:stop]))
+            start = stop
+
         with open(filename, 'wb') as f:
-            for cmd in self.commands:
-                if cmd.raw_bytes:
-                    f.write(cmd.raw_bytes)
-                else:
-                    # Generate raw bytes for commands that don't have them
-                    raw_bytes = self._generate_raw_bytes(cmd)
-                    if raw_bytes:
-                        f.write(raw_bytes)
-
-    def _generate_raw_bytes(self, cmd: PatternCommand) -> bytes:
-        """Generate raw bytes for a command."""
-        if cmd.command_type == CommandType.END:
-            return b''  # End commands don't write bytes
-
-        # Calculate delta from previous position
-        prev_x = getattr(self, '_last_save_x', 0)
-        prev_y = getattr(self, '_last_save_y', 0)
-
-        delta_x = cmd.x - prev_x
-        delta_y = cmd.y - prev_y
-
-        # Update last position for next command
-        self._last_save_x = cmd.x
-        self._last_save_y = cmd.y
-
-        # Handle coordinate encoding to match the reading logic exactly
-        # Reading logic:
-        # if x > 0x80: x -= 0x80; x = -x
-        # if y > 0x80: y -= 0x80; y = -y
-        # y = -y  (Y is negated in format)
-
-        # Limit delta movements to prevent overflow
-        delta_x = max(-127, min(127, delta_x))
-        delta_y = max(-127, min(127, delta_y))
-
-        # Encode X coordinate
-        if delta_x >= 0:
-            x_byte = delta_x
-        else:
-            x_byte = abs(delta_x) + 0x80
-
-        # Encode Y coordinate (reverse the reading logic)
-        # Since reading does: if y > 0x80: y -= 0x80; y = -y; then y = -y
-        # We need to reverse this: negate first, then apply sign encoding
-        neg_delta_y = -delta_y  # Negate for format
-        if neg_delta_y >= 0:
-            y_byte = neg_delta_y
-        else:
-            y_byte = abs(neg_delta_y) + 0x80
-
-        # Determine command byte
-        if cmd.command_type == CommandType.STITCH:
-            cmd_byte = 0x61
-        elif cmd.command_type == CommandType.MOVE:
-            cmd_byte = 0x01  # Use odd number for move
-        elif cmd.command_type == CommandType.COLOR_CHANGE:
-            cmd_byte = 0x02  # Use even number for color change
-        elif cmd.command_type == CommandType.BACKTACK:
-            cmd_byte = 0x03  # Backtack moves
-        elif cmd.command_type == CommandType.PATTERN_END:
-            cmd_byte = 0x1F  # Pattern terminator
-        else:
-            cmd_byte = 0x01  # Default to move
+            f.write(b''.join(parts))
 
-        return bytes([cmd_byte, 0x00, x_byte, y_byte])
+    def _generate_raw_records(self, commands: List[PatternCommand]) -> bytes:
+        """Generate raw bytes for a sequence of commands.
+
+        Each record holds the command byte, an unused byte and the X and Y
+        deltas from the previous generated position, encoded the way the
+        reader decodes them. The byte columns are filled for the whole batch
+        at once.
+        """
+        # End commands don't write bytes
+        encoded = [cmd for cmd in commands if cmd.command_type is not _END]
+        if not encoded:
+            return b''
+
+        xs = array('i', map(_get_x, encoded))
+        ys = array('i', map(_get_y, encoded))
+        prev_x = self._last_save_x
+        prev_y = self._last_save_y
+        self._last_save_x = xs[-1]
+        self._last_save_y = ys[-1]
+
+        # Deltas from the previous position, limited to prevent overflow
+        # (Y is negated in the format)
+        delta_x = [max(-127, min(127, x - px)) for px, x in zip(chain((prev_x,), xs), xs)]
+        delta_y = [max(-127, min(127, py - y)) for py, y in zip(chain((prev_y,), ys), ys)]
+
+        buf = bytearray(4 * len(encoded))
+        buf[0::4] = bytes(map(_COMMAND_BYTES.__getitem__, map(_get_type, encoded)))
+        buf[2::4] = bytes(map(_DELTA_BYTES.__getitem__, delta_x))
+        buf[3::4] = bytes(map(_DELTA_BYTES.__getitem__, delta_y))
+        return bytes(buf)
 
     def create_new_pattern(self):
         """Create a new empty pattern."""
@@ -262,7 +317,7 @@ class Mitsubishi100Parser:
     def add_stitch(self, x: int, y: int):
         """Add a stitch command at the specified coordinates."""
         cmd = PatternCommand(
-            command_type=CommandType.STITCH,
+            command_type=_STITCH,
             x=x,
             y=y
         )
@@ -271,7 +326,7 @@ class Mitsubishi100Parser:
     def add_move(self, x: int, y: int):
         """Add a move command to the specified coordinates."""
         cmd = PatternCommand(
-            command_type=CommandType.MOVE,
+            command_type=_MOVE,
             x=x,
             y=y
         )
@@ -376,81 +431,22 @@ class Mitsubishi100Parser:
     def add_stitch_line(self, start_x: int, start_y: int, end_x: int, end_y: int,
                        stitch_spacing: float = 20.0):
         """Add a line of evenly distributed stitches between two points."""
-        import math
+        self._extend_stitches(*_stitch_line_points(start_x, start_y, end_x, end_y, stitch_spacing))
 
-        # Calculate line length
-        dx = end_x - start_x
-        dy = end_y - start_y
-        line_length = math.sqrt(dx * dx + dy * dy)
-
-        if line_length == 0:
-            # Single point
-            self.add_stitch(start_x, start_y)
-            return
-
-        # Calculate number of stitches needed
-        num_stitches = max(2, int(line_length / stitch_spacing) + 1)
-
-        # Generate stitches along the line
-        for i in range(num_stitches):
-            t = i / (num_stitches - 1) if num_stitches > 1 else 0
-            x = int(start_x + t * dx)
-            y = int(start_y + t * dy)
-            self.add_stitch(x, y)
+    def _extend_stitches(self, xs, ys):
+        """Append a stitch command for every (x, y) coordinate pair."""
+        self.commands.extend(map(PatternCommand, repeat(_STITCH), xs, ys))
 
     def add_rectangle_stitches(self, center_x: int, center_y: int, width: int, height: int,
                               stitch_spacing: float = 20.0):
         """Add a rectangular pattern of stitches."""
-        half_w = width // 2
-        half_h = height // 2
-
-        # Calculate corner positions
-        corners = [
-            (center_x - half_w, center_y - half_h),  # Top-left
-            (center_x + half_w, center_y - half_h),  # Top-right
-            (center_x + half_w, center_y + half_h),  # Bottom-right
-            (center_x - half_w, center_y + half_h),  # Bottom-left
-        ]
-
-        # Add move to start position
-        self.add_move(corners[0][0], corners[0][1])
-
-        # Create stitched outline
-        for i in range(len(corners)):
-            start_corner = corners[i]
-            end_corner = corners[(i + 1) % len(corners)]
-
-            # Don't add the first point again (except for the very first)
-            if i == 0:
-                self.add_stitch_line(start_corner[0], start_corner[1],
-                                    end_corner[0], end_corner[1], stitch_spacing)
-            else:
-                # Skip the first point to avoid duplicates
-                self.add_stitch_line_segment(start_corner[0], start_corner[1],
-                                           end_corner[0], end_corner[1], stitch_spacing, skip_first=True)
+        self.commands.extend(_rectangle_commands(center_x, center_y, width, height, stitch_spacing))
 
     def add_stitch_line_segment(self, start_x: int, start_y: int, end_x: int, end_y: int,
                                stitch_spacing: float = 20.0, skip_first: bool = False):
         """Add a line segment of stitches, optionally skipping the first stitch."""
-        import math
-
-        dx = end_x - start_x
-        dy = end_y - start_y
-        line_length = math.sqrt(dx * dx + dy * dy)
-
-        if line_length == 0:
-            if not skip_first:
-                self.add_stitch(start_x, start_y)
-            return
-
-        num_stitches = max(2, int(line_length / stitch_spacing) + 1)
-        start_index = 1 if skip_first else 0
-
-        for i in range(start_index, num_stitches):
-            t = i / (num_stitches - 1) if num_stitches > 1 else 0
-            x = int(start_x + t * dx)
-            y = int(start_y + t * dy)
-            self.add_stitch(x, y)
+        self._extend_stitches(*_stitch_line_points(start_x, start_y, end_x, end_y,
+                                                   stitch_spacing, skip_first))
 
     def generate_qr_code(self, text: str, center_x: int = 0, center_y: int = 0,
                          module_size: int = 8, stitch_spacing: float = 10.0,
@@ -541,19 +537,16 @@ class Mitsubishi100Parser:
                abs(center_y + half_size) > 100 or abs(center_y - half_size) > 100:
                 return (False, f"QR code extends beyond 20x20mm stitch area", 0)
 
-            # Generate stitches for black modules
-            modules_stitched = 0
-            for i, row in enumerate(matrix):
-                for j, is_black in enumerate(row):
-                    if is_black:
-                        module_center_x = start_x + j * module_size + module_size // 2
-                        module_center_y = start_y + i * module_size + module_size // 2
-
-                        # Add a small rectangle of stitches for each black module
-                        self.add_rectangle_stitches(module_center_x, module_center_y,
-                                                   max(4, module_size - 2), max(4, module_size - 2),
-                                                   stitch_spacing)
-                        modules_stitched += 1
+            # Generate stitches for black modules: a small rectangle of
+            # stitches for each, appended to the pattern in one batch
+            half_module = module_size // 2
+            side = max(4, module_size - 2)
+            module_centers = [(start_x + j * module_size + half_module, start_y + i * module_size + half_module)
+                              for i, row in enumerate(matrix)
+                              for j, is_black in enumerate(row) if is_black]
+            self.commands.extend(chain.from_iterable(
+                _rectangle_commands(x, y, side, side, stitch_spacing) for x, y in module_centers))
+            modules_stitched = len(module_centers)
 
             # Calculate data capacity for this QR version and error correction level
             capacity_map = {
@@ -585,24 +578,17 @@ class Mitsubishi100Parser:
     def generate_simple_qr_pattern(self, text: str, center_x: int = 0, center_y: int = 0,
                                   module_size: int = 8, stitch_spacing: float = 10.0):
         """Generate a simple QR-like pattern using text hash."""
-        import hashlib
-
         # Create a simple hash-based pattern (not a real QR code)
-        text_hash = hashlib.md5(text.encode()).hexdigest()
+        digest = hashlib.md5(text.encode()).digest()
+
+        # A module is filled when its hex digit of the hash is above 7,
+        # i.e. when the high bit of the corresponding nibble is set
+        nibbles = [bool(byte & mask) for byte in digest for mask in (0x80, 0x08)]
 
         # Create a simple 8x8 grid pattern based on hash
         grid_size = 8
-        pattern = []
-
-        # Convert hash characters to binary pattern
-        for i in range(grid_size):
-            row = []
-            for j in range(grid_size):
-                hash_index = (i * grid_size + j) % len(text_hash)
-                # Use hash character value to determine if module is filled
-                filled = int(text_hash[hash_index], 16) > 7
-                row.append(filled)
-            pattern.append(row)
+        pattern = [[nibbles[(i * grid_size + j) % len(nibbles)] for j in range(grid_size)]
+                   for i in range(grid_size)]
 
         # Add border (QR codes have quiet zones)
         bordered_pattern = []
@@ -623,23 +609,24 @@ class Mitsubishi100Parser:
         start_x = center_x - total_size // 2
         start_y = center_y - total_size // 2
 
-        # Generate stitches for filled modules
-        for i, row in enumerate(bordered_pattern):
-            for j, filled in enumerate(row):
-                if filled:
-                    module_center_x = start_x + j * module_size + module_size // 2
-                    module_center_y = start_y + i * module_size + module_size // 2
-
-                    # Add a small rectangle of stitches for each filled module
-                    self.add_rectangle_stitches(module_center_x, module_center_y,
-                                              module_size - 2, module_size - 2, stitch_spacing)
+        # Generate stitches for filled modules: a small rectangle of stitches
+        # for each, appended to the pattern in one batch
+        half_module = module_size // 2
+        side = module_size - 2
+        self.commands.extend(chain.from_iterable(
+            _rectangle_commands(start_x + j * module_size + half_module,
+                                start_y + i * module_size + half_module,
+                                side, side, stitch_spacing)
+            for i, row in enumerate(bordered_pattern)
+            for j, filled in enumerate(row) if filled))
 
         return total_size  # Return the total size for reference
 
     def export_to_csv(self, output_filename: str):
         """Export pattern to CSV format."""
+        rows = [f"{i},{_COMMAND_NAMES[cmd.command_type]},{cmd.x},{cmd.y},{cmd.raw_bytes.hex() if cmd.raw_bytes else ''}\n"
+                for i, cmd in enumerate(self.commands)]
+
         with open(output_filename, 'w') as f:
             f.write("Index,Command,X,Y,RawBytes\n")
-            for i, cmd in enumerate(self.commands):
-                raw_hex = cmd.raw_bytes.hex() if cmd.raw_bytes else ""
-                f.write(f"{i},{cmd.command_type.value},{cmd.x},{cmd.y},{raw_hex}\n")
\ No newline at end of file
+            f.write("".join(rows))
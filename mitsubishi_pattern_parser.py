@@ -26,6 +26,11 @@ import os
 from typing import List, Tuple, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
+from itertools import chain, compress
+from collections import Counter
+from array import array
+from operator import attrgetter, sub
+from math import hypot
 
 class CommandType(Enum):
     POINT = 0x61
@@ -49,7 +54,11 @@ class FunctionCode(Enum):
     END_DATA = 0x0031
     # Reserved codes 0x0008-0x0030
 
-@dataclass
+# Function code value -> member and human-readable name, so lookups need no exception handling
+_FUNCTION_CODES = {code.value: code for code in FunctionCode}
+_FUNCTION_NAMES = {code.value: code.name.replace('_', ' ').title() for code in FunctionCode}
+
+@dataclass(slots=True)
 class PatternCommand:
     command_type: CommandType
     x: int = 0
@@ -65,17 +74,116 @@ class PatternCommand:
     def get_function_name(self) -> str:
         """Get human-readable function name if this is a function command."""
         if self.function_code:
-            return self.function_code.name.replace('_', ' ').title()
+            return _FUNCTION_NAMES[self.function_code.value]
         elif self.command_type == CommandType.FUNCTION and self.parameters:
             # Try to decode function from parameters
             if len(self.parameters) >= 2:
                 func_code = (self.parameters[1] << 8) | self.parameters[0]  # Little-endian
-                try:
-                    return FunctionCode(func_code).name.replace('_', ' ').title()
-                except ValueError:
-                    return f"Unknown Function {func_code:04X}"
+                name = _FUNCTION_NAMES.get(func_code)
+                return name if name is not None else f"Unknown Function {func_code:04X}"
         return ""
 
+# Commands that carry an x,y position
+_COORDINATE_TYPES = (CommandType.POINT, CommandType.LINEAR_MOVE, CommandType.CIRCULAR)
+
+_get_type = attrgetter('command_type')
+_get_x = attrgetter('x')
+_get_y = attrgetter('y')
+_get_type_name = attrgetter('command_type.name')
+
+
+def _count_command_types(commands: List[PatternCommand]) -> Dict[str, int]:
+    """Count commands per command type name, in order of first appearance."""
+    return dict(Counter(map(_get_type_name, commands)))
+
+def _coordinate_columns(commands: List[PatternCommand]) -> Tuple[array, array]:
+    """Get the X and Y positions of all coordinate commands as int arrays."""
+    mask = list(map(_COORDINATE_TYPES.__contains__, map(_get_type, commands)))
+    return (array('i', map(_get_x, compress(commands, mask))),
+            array('i', map(_get_y, compress(commands, mask))))
+
+# Module-level aliases so the per-record decoders skip the class attribute lookup
+_POINT = CommandType.POINT
+_LINEAR_MOVE = CommandType.LINEAR_MOVE
+_CIRCULAR = CommandType.CIRCULAR
+_FUNCTION = CommandType.FUNCTION
+_UNKNOWN = CommandType.UNKNOWN
+
+# Precompiled coordinate layouts following the command byte
+_unpack_linear_xy = struct.Struct('<HH').unpack_from  # x,y as little-endian 16-bit values
+_unpack_point_xy = struct.Struct('<BH').unpack_from   # x as a byte, y as a little-endian 16-bit value
+
+def _decode_linear_move(data: bytes, i: int) -> PatternCommand:
+    """Decode a linear move command."""
+    x, y = _unpack_linear_xy(data, i + 1)
+    return PatternCommand(_LINEAR_MOVE, x, y, None, data[i:i+5])
+
+def _decode_point(data: bytes, i: int) -> PatternCommand:
+    """Decode a point/stitch command."""
+    x, y = _unpack_point_xy(data, i + 1)
+    return PatternCommand(_POINT, x, y, None, data[i:i+4])
+
+def _decode_circular(data: bytes, i: int) -> PatternCommand:
+    """Decode a circular command (observed in patterns), laid out like a point."""
+    x, y = _unpack_point_xy(data, i + 1)
+    return PatternCommand(_CIRCULAR, x, y, None, data[i:i+4])
+
+def _decode_function(data: bytes, i: int) -> PatternCommand:
+    """Decode a function command, resolving its function code when known."""
+    # Function code from the first two parameters (None if unknown)
+    function_code = _FUNCTION_CODES.get(data[i+1] | data[i+2] << 8)
+    return PatternCommand(_FUNCTION, 0, 0, [data[i+1], data[i+2], data[i+3]], data[i:i+4], function_code)
+
+def _parameter_decoder(command_type: CommandType):
+    """Make a decoder for commands carrying three raw parameter bytes."""
+    def decode(data: bytes, i: int) -> PatternCommand:
+        return PatternCommand(command_type, 0, 0, [data[i+1], data[i+2], data[i+3]], data[i:i+4])
+    return decode
+
+# Command byte -> (record length, decoder); None for unknown command bytes
+_DISPATCH = [None] * 256
+_DISPATCH[0x03] = (5, _decode_linear_move)
+_DISPATCH[0x61] = (4, _decode_point)
+_DISPATCH[0xE1] = (4, _decode_circular)
+_DISPATCH[0x1F] = (4, _decode_function)
+_DISPATCH[0x82] = (4, _parameter_decoder(CommandType.ARC))
+_DISPATCH[0x83] = (4, _parameter_decoder(CommandType.CURVE))
+_DISPATCH[0x02] = (4, _parameter_decoder(CommandType.SPEED))
+_DISPATCH[0x01] = (4, _parameter_decoder(CommandType.SEPARATOR))
+_DISPATCH = tuple(_DISPATCH)
+
+def _scan_records(data: bytes) -> List[PatternCommand]:
+    """Scan binary pattern data into a list of commands.
+
+    Records are variable length (5 bytes for linear moves, 4 for the other known
+    commands, 1 for unknown bytes), so the data is walked sequentially, looking
+    up each command byte in _DISPATCH. A known command byte without enough data
+    left for its record is skipped.
+    """
+    commands = []
+    append = commands.append
+    dispatch = _DISPATCH
+    command = PatternCommand
+    unknown = _UNKNOWN
+    n = len(data)
+    i = 0
+    while i < n:
+        entry = dispatch[data[i]]
+        if entry is None:
+            # Unknown command, try to handle gracefully
+            append(command(unknown, 0, 0, [data[i]], data[i:i+1]))
+            i += 1
+            continue
+
+        length, decode = entry
+        if i + length <= n:
+            append(decode(data, i))
+            i += length
+        else:
+            i += 1
+
+    return commands
+
 class MitsubishiPatternParser:
     def __init__(self):
         self.commands = []
@@ -97,158 +205,20 @@ class MitsubishiPatternParser:
         Validation shows that 0x03 bytes appear to be coordinate data, not command types.
         The actual command structure may be fundamentally different.
         """
-        i = 0
-        while i < len(data):
-            if i >= len(data):
-                break
-
-            # Read command byte and parameters
-            cmd_byte = data[i]
-
-            if cmd_byte == 0x03:  # Linear movement command
-                if i + 4 < len(data):
-                    # Extract x,y coordinates (little-endian 16-bit values)
-                    x = struct.unpack('<H', data[i+1:i+3])[0]
-                    y = struct.unpack('<H', data[i+3:i+5])[0]
-
-                    command = PatternCommand(
-                        command_type=CommandType.LINEAR_MOVE,
-                        x=x,
-                        y=y,
-                        raw_data=data[i:i+5]
-                    )
-                    self.commands.append(command)
-                    i += 5
-                else:
-                    i += 1
-
-            elif cmd_byte == 0x61:  # Point/stitch command
-                if i + 3 < len(data):
-                    # Extract x,y coordinates - first byte is x, next 2 bytes are y (little-endian)
-                    x = data[i+1]
-                    y = struct.unpack('<H', data[i+2:i+4])[0]
-
-                    command = PatternCommand(
-                        command_type=CommandType.POINT,
-                        x=x,
-                        y=y,
-                        raw_data=data[i:i+4]
-                    )
-                    self.commands.append(command)
-                    i += 4
-                else:
-                    i += 1
-
-            elif cmd_byte == 0xE1:  # Circular command (observed in patterns)
-                if i + 3 < len(data):
-                    # Similar structure to point commands
-                    x = data[i+1]
-                    y = struct.unpack('<H', data[i+2:i+4])[0]
-
-                    command = PatternCommand(
-                        command_type=CommandType.CIRCULAR,
-                        x=x,
-                        y=y,
-                        raw_data=data[i:i+4]
-                    )
-                    self.commands.append(command)
-                    i += 4
-                else:
-                    i += 1
-
-            elif cmd_byte == 0x82:  # Arc command
-                if i + 3 < len(data):
-                    command = PatternCommand(
-                        command_type=CommandType.ARC,
-                        parameters=[data[i+1], data[i+2], data[i+3]],
-                        raw_data=data[i:i+4]
-                    )
-                    self.commands.append(command)
-                    i += 4
-                else:
-                    i += 1
-
-            elif cmd_byte == 0x83:  # Curve command
-                if i + 3 < len(data):
-                    command = PatternCommand(
-                        command_type=CommandType.CURVE,
-                        parameters=[data[i+1], data[i+2], data[i+3]],
-                        raw_data=data[i:i+4]
-                    )
-                    self.commands.append(command)
-                    i += 4
-                else:
-                    i += 1
-
-            elif cmd_byte == 0x02:  # Speed command
-                if i + 3 < len(data):
-                    command = PatternCommand(
-                        command_type=CommandType.SPEED,
-                        parameters=[data[i+1], data[i+2], data[i+3]],
-                        raw_data=data[i:i+4]
-                    )
-                    self.commands.append(command)
-                    i += 4
-                else:
-                    i += 1
-
-            elif cmd_byte == 0x1F:  # Function command
-                if i + 3 < len(data):
-                    params = [data[i+1], data[i+2], data[i+3]]
-                    command = PatternCommand(
-                        command_type=CommandType.FUNCTION,
-                        parameters=params,
-                        raw_data=data[i:i+4]
-                    )
-
-                    # Try to decode function code from parameters
-                    if len(params) >= 2:
-                        func_code = struct.unpack('<H', bytes(params[:2]))[0]
-                        try:
-                            command.function_code = FunctionCode(func_code)
-                        except ValueError:
-                            pass  # Unknown function code
-
-                    self.commands.append(command)
-                    i += 4
-                else:
-                    i += 1
-
-            elif cmd_byte == 0x01:  # Separator/delimiter
-                if i + 3 < len(data):
-                    command = PatternCommand(
-                        command_type=CommandType.SEPARATOR,
-                        parameters=[data[i+1], data[i+2], data[i+3]],
-                        raw_data=data[i:i+4]
-                    )
-                    self.commands.append(command)
-                    i += 4
-                else:
-                    i += 1
-
-            else:
-                # Unknown command, try to handle gracefully
-                command = PatternCommand(
-                    command_type=CommandType.UNKNOWN,
-                    parameters=[cmd_byte],
-                    raw_data=data[i:i+1]
-                )
-                self.commands.append(command)
-                i += 1
+        self.commands.extend(_scan_records(data))
 
     def print_pattern_info(self, filepath: str) -> None:
         """Print detailed information about a pattern file."""
-        commands = self.parse_file(filepath)
+        self._print_commands_info(filepath, self.parse_file(filepath))
 
+    def _print_commands_info(self, filepath: str, commands: List[PatternCommand]) -> None:
+        """Print detailed information about the commands parsed from a pattern file."""
         print(f"\n=== Pattern File: {os.path.basename(filepath)} ===")
         print(f"File size: {os.path.getsize(filepath)} bytes")
         print(f"Total commands: {len(commands)}")
 
         # Count command types
-        cmd_counts = {}
-        for cmd in commands:
-            cmd_type = cmd.command_type.name
-            cmd_counts[cmd_type] = cmd_counts.get(cmd_type, 0) + 1
+        cmd_counts = _count_command_types(commands)
 
         print("\nCommand distribution:")
         for cmd_type, count in cmd_counts.items():
@@ -281,87 +251,70 @@ class MitsubishiPatternParser:
 
     def get_coordinates(self) -> List[Tuple[int, int]]:
         """Extract all x,y coordinates from the pattern."""
-        coords = []
-        for cmd in self.commands:
-            if cmd.command_type in [CommandType.POINT, CommandType.LINEAR_MOVE, CommandType.CIRCULAR]:
-                coords.append((cmd.x, cmd.y))
-        return coords
+        return list(zip(*_coordinate_columns(self.commands)))
 
     def get_bounding_box(self) -> Tuple[int, int, int, int]:
         """Get the bounding box of the pattern (min_x, min_y, max_x, max_y)."""
-        coords = self.get_coordinates()
-        if not coords:
+        x_coords, y_coords = _coordinate_columns(self.commands)
+        if not x_coords:
             return (0, 0, 0, 0)
 
-        x_coords = [x for x, y in coords]
-        y_coords = [y for x, y in coords]
-
         return (min(x_coords), min(y_coords), max(x_coords), max(y_coords))
 
     def export_to_csv(self, filepath: str, output_csv: str) -> None:
         """Export pattern commands to CSV format."""
-        commands = self.parse_file(filepath)
+        self._write_csv(self.parse_file(filepath), output_csv)
+
+    def _write_csv(self, commands: List[PatternCommand], output_csv: str) -> None:
+        """Write parsed pattern commands to a CSV file."""
+        rows = [f"{i},{cmd.command_type.name},{cmd.x},{cmd.y},"
+                f"\"{','.join(map(str, cmd.parameters)) if cmd.parameters else ''}\","
+                f"{cmd.raw_data.hex() if cmd.raw_data else ''}\n"
+                for i, cmd in enumerate(commands, 1)]
 
         with open(output_csv, 'w') as f:
             f.write("Command,Type,X,Y,Parameters,Raw_Hex\n")
+            f.write("".join(rows))
 
-            for i, cmd in enumerate(commands):
-                raw_hex = cmd.raw_data.hex() if cmd.raw_data else ""
-                params_str = ",".join(map(str, cmd.parameters)) if cmd.parameters else ""
+    def analyze_pattern_motion(self, filepath: str) -> Dict[str, Any]:
+        """Analyze the motion characteristics of a pattern file."""
+        return self.analyze_commands(self.parse_file(filepath))
 
-                f.write(f"{i+1},{cmd.command_type.name},{cmd.x},{cmd.y},\"{params_str}\",{raw_hex}\n")
+    def analyze_commands(self, commands: List[PatternCommand]) -> Dict[str, Any]:
+        """Analyze the motion characteristics of parsed pattern commands.
 
-    def analyze_pattern_motion(self, filepath: str) -> Dict[str, Any]:
-        """Analyze the motion characteristics of a pattern."""
-        commands = self.parse_file(filepath)
+        The path length is the distance travelled through all coordinate
+        commands in order, starting from the origin.
+        """
+        types = list(map(_get_type, commands))
 
         analysis = {
             'total_commands': len(commands),
-            'command_counts': {},
-            'stitch_points': 0,
-            'movement_commands': 0,
-            'speed_changes': 0,
-            'function_calls': 0,
+            'command_counts': _count_command_types(commands),
+            'stitch_points': types.count(CommandType.POINT),
+            'movement_commands': types.count(CommandType.LINEAR_MOVE) + types.count(CommandType.CIRCULAR),
+            'speed_changes': types.count(CommandType.SPEED),
+            'function_calls': types.count(CommandType.FUNCTION),
             'coordinate_range': {'x': [0, 0], 'y': [0, 0]},
             'path_length': 0.0
         }
 
-        coords = []
-        prev_x, prev_y = 0, 0
-
-        for cmd in commands:
-            cmd_type = cmd.command_type.name
-            analysis['command_counts'][cmd_type] = analysis['command_counts'].get(cmd_type, 0) + 1
-
-            if cmd.command_type == CommandType.POINT:
-                analysis['stitch_points'] += 1
-                coords.append((cmd.x, cmd.y))
-                # Calculate path distance
-                if coords:
-                    analysis['path_length'] += ((cmd.x - prev_x)**2 + (cmd.y - prev_y)**2)**0.5
-                prev_x, prev_y = cmd.x, cmd.y
-
-            elif cmd.command_type in [CommandType.LINEAR_MOVE, CommandType.CIRCULAR]:
-                analysis['movement_commands'] += 1
-                coords.append((cmd.x, cmd.y))
-                if coords:
-                    analysis['path_length'] += ((cmd.x - prev_x)**2 + (cmd.y - prev_y)**2)**0.5
-                prev_x, prev_y = cmd.x, cmd.y
-
-            elif cmd.command_type == CommandType.SPEED:
-                analysis['speed_changes'] += 1
-
-            elif cmd.command_type == CommandType.FUNCTION:
-                analysis['function_calls'] += 1
-
-        if coords:
-            x_coords = [x for x, y in coords]
-            y_coords = [y for x, y in coords]
+        x_coords, y_coords = _coordinate_columns(commands)
+        if x_coords:
             analysis['coordinate_range']['x'] = [min(x_coords), max(x_coords)]
             analysis['coordinate_range']['y'] = [min(y_coords), max(y_coords)]
 
+            # Distances between consecutive positions, the first one from the origin
+            prev_x = chain((0,), x_coords)
+            prev_y = chain((0,), y_coords)
+            analysis['path_length'] = float(sum(map(hypot, map(sub, x_coords, prev_x),
+                                                    map(sub, y_coords, prev_y))))
+
         return analysis
 
+# Extensions of the sample pattern files analyzed by main()
+_PATTERN_EXTENSIONS = ('.100', '.101', '.102', '.103', '.105', '.106', '.107', '.109', '.114', '.118')
+
 def main():
     """Main function to demonstrate the parser."""
     parser = MitsubishiPatternParser()
@@ -371,30 +324,31 @@ def main():
         print(f"Error: {patterns_dir} directory not found!")
         return
 
-    # Get all pattern files
-    pattern_files = [f for f in os.listdir(patterns_dir) if f.endswith(('.100', '.101', '.102', '.103', '.105', '.106', '.107', '.109', '.114', '.118'))]
+    # Get all pattern files; directory entries carry their names and cached stat results
+    with os.scandir(patterns_dir) as entries:
+        pattern_files = [entry for entry in entries if entry.name.endswith(_PATTERN_EXTENSIONS)]
 
     if not pattern_files:
         print(f"No pattern files found in {patterns_dir}!")
         return
 
     print("Available pattern files:")
-    for i, filename in enumerate(pattern_files, 1):
-        filepath = os.path.join(patterns_dir, filename)
-        print(f"{i:2d}. {filename} ({os.path.getsize(filepath)} bytes)")
+    for i, entry in enumerate(pattern_files, 1):
+        print(f"{i:2d}. {entry.name} ({entry.stat().st_size} bytes)")
 
-    # Analyze each pattern file
-    for filename in pattern_files:
-        filepath = os.path.join(patterns_dir, filename)
-        parser.print_pattern_info(filepath)
+    # Analyze each pattern file, parsing it once for all reports
+    for entry in pattern_files:
+        filepath = entry.path
+        commands = parser.parse_file(filepath)
+        parser._print_commands_info(filepath, commands)
 
         # Get bounding box
         bbox = parser.get_bounding_box()
         print(f"Bounding box: ({bbox[0]}, {bbox[1]}) to ({bbox[2]}, {bbox[3]})")
 
         # Export to CSV for detailed analysis
-        csv_filename = f"{filename}.csv"
-        parser.export_to_csv(filepath, csv_filename)
+        csv_filename = f"{entry.name}.csv"
+        parser._write_csv(commands, csv_filename)
         print(f"Exported to: {csv_filename}")
 
 if __name__ == "__main__":
@@ -4,16 +4,21 @@ Pattern File Analyzer - Examine raw binary data for special control codes
 """
 
 import os
-import struct
 from typing import List, Tuple
 
+# Pattern file extensions (.100 and .001-.300)
+_PATTERN_EXTENSIONS = tuple(f'.{ext}' for ext in ['100'] + [f'{i:03d}' for i in range(1, 301)])
+
+# Byte -> itself if printable ASCII, otherwise '.'
+_PRINTABLE_ASCII = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+
 def hex_dump(data: bytes, offset: int = 0, width: int = 16) -> str:
     """Create a hex dump of binary data."""
     lines = []
     for i in range(0, len(data), width):
         chunk = data[i:i+width]
-        hex_part = ' '.join(f'{b:02x}' for b in chunk)
-        ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
+        hex_part = chunk.hex(' ')
+        ascii_part = chunk.translate(_PRINTABLE_ASCII).decode('ascii')
         lines.append(f'{offset+i:08x}  {hex_part:<{width*3-1}}  {ascii_part}')
     return '\n'.join(lines)
 
@@ -45,34 +50,28 @@ def analyze_pattern_ending(filename: str, last_bytes: int = 100) -> None:
             print(f"{'Offset':<8} {'Cmd':<4} {'B1':<4} {'X':<4} {'Y':<4} {'Notes'}")
             print(f"{'-'*40}")
 
-            for i in range(0, len(data), 4):
-                if i + 3 < len(data):
-                    chunk = data[i:i+4]
-                    cmd, b1, x, y = struct.unpack('<BBBB', chunk)
-                    offset = start_offset + i
-
-                    # Decode coordinates
-                    x_val = x if x <= 0x80 else -(x - 0x80)
-                    y_val = y if y <= 0x80 else -(y - 0x80)
-                    y_val = -y_val  # Y is negated
-
-                    notes = []
-                    if cmd == 0x61:
-                        notes.append("STITCH")
-                    elif cmd & 0x01:
-                        notes.append("MOVE")
-                    elif cmd % 2 == 0:
-                        notes.append("COLOR_CHANGE")
-
-                    # Check for special patterns
-                    if cmd == 0x00:
-                        notes.append("NULL/END?")
-                    if x == 0 and y == 0:
-                        notes.append("ZERO_COORDS")
-                    if chunk == b'\x00\x00\x00\x00':
-                        notes.append("ALL_ZEROS")
-
-                    print(f"{offset:08x} {cmd:02x}   {b1:02x}   {x:02x}   {y:02x}   {' '.join(notes)}")
+            # Decode the byte columns of all complete records at once
+            size = len(data) - len(data) % 4
+            offsets = range(start_offset, start_offset + size, 4)
+            for offset, cmd, b1, x, y in zip(offsets, data[0:size:4], data[1:size:4],
+                                             data[2:size:4], data[3:size:4]):
+                notes = []
+                if cmd == 0x61:
+                    notes.append("STITCH")
+                elif cmd & 0x01:
+                    notes.append("MOVE")
+                elif cmd % 2 == 0:
+                    notes.append("COLOR_CHANGE")
+
+                # Check for special patterns
+                if cmd == 0x00:
+                    notes.append("NULL/END?")
+                if x == 0 and y == 0:
+                    notes.append("ZERO_COORDS")
+                if cmd == 0 and b1 == 0 and x == 0 and y == 0:
+                    notes.append("ALL_ZEROS")
+
+                print(f"{offset:08x} {cmd:02x}   {b1:02x}   {x:02x}   {y:02x}   {' '.join(notes)}")
 
             # Look for specific end patterns
             print(f"\nSpecial pattern analysis:")
@@ -101,7 +100,7 @@ def compare_pattern_endings(directory: str = "Patterns") -> None:
 
     pattern_files = []
     for file in os.listdir(directory):
-        if any(file.endswith(f'.{ext}') for ext in ['100'] + [f'{i:03d}' for i in range(1, 301)]):
+        if file.endswith(_PATTERN_EXTENSIONS):
             pattern_files.append(os.path.join(directory, file))
 
     if not pattern_files:
@@ -126,20 +125,17 @@ def compare_pattern_endings(directory: str = "Patterns") -> None:
         try:
             with open(filename, 'rb') as f:
                 f.seek(-16, 2)  # Last 16 bytes
-                ending = f.read()
-                endings[filename] = ending.hex()
+                endings[filename] = f.read()
         except:
-            endings[filename] = "ERROR"
+            endings[filename] = None  # Reported as ERROR
 
-    # Group by ending pattern
+    # Group by the raw ending bytes, hex-encoding each group once for display
     ending_groups = {}
     for filename, ending in endings.items():
-        if ending not in ending_groups:
-            ending_groups[ending] = []
-        ending_groups[ending].append(filename)
+        ending_groups.setdefault(ending, []).append(filename)
 
     for ending, files in ending_groups.items():
-        print(f"\nEnding pattern: {ending}")
+        print(f"\nEnding pattern: {ending.hex() if ending is not None else 'ERROR'}")
         print(f"Files with this ending:")
         for file in files:
             print(f"  - {os.path.basename(file)}")
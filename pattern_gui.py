@@ -12,8 +12,93 @@ import tkinter.font as tkFont
 from mitsubishi_pattern_parser import MitsubishiPatternParser, CommandType, PatternCommand
 import os
 import math
+import mmap
+import struct
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import compress
+from operator import attrgetter
 from typing import Optional, List, Tuple
 
+# Command types that carry a drawable X/Y position
+_DRAWABLE_TYPES = (CommandType.POINT, CommandType.LINEAR_MOVE, CommandType.CIRCULAR)
+
+# Radius of the dot drawn for each drawable command type
+_POINT_SIZES = {CommandType.POINT: 3, CommandType.LINEAR_MOVE: 2, CommandType.CIRCULAR: 2}
+
+# Command list rows: the padded type-name column of each command type, and
+# the row layout for commands that carry a position
+_TYPE_LABELS = {command_type: f"{command_type.name:12s}" for command_type in CommandType}
+_POSITION_ROW = "{:3d}: {} ({:5d}, {:5d})"
+
+# G-code line for each exported command type, given X and Y in millimetres
+_GCODE_TEMPLATES = {
+    CommandType.POINT: "G1 X{:.2f} Y{:.2f} ; Stitch\n",
+    CommandType.LINEAR_MOVE: "G0 X{:.2f} Y{:.2f} ; Move\n",
+    CommandType.CIRCULAR: "G2 X{:.2f} Y{:.2f} ; Circular\n",
+}
+
+# Function codes from the PLK-A0804F manual looked for by the validation
+# report, and their names keyed by the little-endian bytes searched for
+_MANUAL_CODES = {
+    0x0002: "Thread Trimming",
+    0x0003: "Feed",
+    0x0004: "HALT",
+    0x0005: "Reverse Rotation",
+    0x0006: "Second Home Position",
+    0x0007: "Basting",
+    0x0031: "END Data"
+}
+_MANUAL_CODE_BYTES = {struct.pack('<H', code): name for code, name in _MANUAL_CODES.items()}
+
+# Raw record written for points added in the editor
+_POINT_STRUCT = struct.Struct('<BHH')
+
+_get_type = attrgetter('command_type')
+_get_x = attrgetter('x')
+_get_y = attrgetter('y')
+
+
+def _drawable_columns(commands: List[PatternCommand]) -> Tuple[array, array]:
+    """Get the X and Y positions of all drawable commands as int arrays."""
+    mask = list(map(_DRAWABLE_TYPES.__contains__, map(_get_type, commands)))
+    return (array('i', map(_get_x, compress(commands, mask))),
+            array('i', map(_get_y, compress(commands, mask))))
+
+
+def _extents(x_coords: array, y_coords: array) -> Tuple[int, int, int, int]:
+    """Get (min_x, min_y, max_x, max_y) of non-empty coordinate columns in one pass."""
+    min_x = max_x = x_coords[0]
+    min_y = max_y = y_coords[0]
+    for x, y in zip(x_coords, y_coords):
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+    return min_x, min_y, max_x, max_y
+
+
+def _last_drawable_index(commands: List[PatternCommand], stop: Optional[int] = None) -> Optional[int]:
+    """Get the index of the last drawable command before stop, or None."""
+    if stop is None:
+        stop = len(commands)
+    for i in range(stop - 1, -1, -1):
+        if commands[i].command_type in _DRAWABLE_TYPES:
+            return i
+    return None
+
+
+def _position_columns(commands: List[PatternCommand]) -> Tuple[array, array]:
+    """Get the X and Y positions of every command that has one as int arrays."""
+    commands = [cmd for cmd in commands if cmd.x is not None]
+    return array('i', map(_get_x, commands)), array('i', map(_get_y, commands))
+
+
 class PatternCanvas(tk.Canvas):
     """Custom canvas for displaying and editing sewing patterns."""
 
@@ -33,6 +118,10 @@ class PatternCanvas(tk.Canvas):
         self.last_mouse_x = 0
         self.last_mouse_y = 0
         self.selected_point = None
+        self.point_dragged = False  # Whether the selected point moved since the click
+        self.redraw_pending = False
+        self.culled = False  # Whether the last draw skipped off-screen items
+        self.line_vertices = {}  # Command index -> (polyline item, vertex number)
 
         # Bind events
         self.bind("<Button-1>", self.on_click)
@@ -63,19 +152,9 @@ class PatternCanvas(tk.Canvas):
 
     def calculate_bounds(self):
         """Calculate the bounding box of the pattern."""
-        if not self.pattern_commands:
-            self.pattern_bounds = (0, 0, 100, 100)
-            return
-
-        coords = []
-        for cmd in self.pattern_commands:
-            if cmd.command_type in [CommandType.POINT, CommandType.LINEAR_MOVE, CommandType.CIRCULAR]:
-                coords.append((cmd.x, cmd.y))
-
-        if coords:
-            x_coords = [x for x, y in coords]
-            y_coords = [y for x, y in coords]
-            self.pattern_bounds = (min(x_coords), min(y_coords), max(x_coords), max(y_coords))
+        x_coords, y_coords = _drawable_columns(self.pattern_commands)
+        if x_coords:
+            self.pattern_bounds = _extents(x_coords, y_coords)
         else:
             self.pattern_bounds = (0, 0, 100, 100)
 
@@ -118,6 +197,17 @@ class PatternCanvas(tk.Canvas):
         world_y = (canvas_y - self.offset_y) / self.scale
         return world_x, world_y
 
+    def request_redraw(self):
+        """Schedule a redraw for when Tk is idle, coalescing repeated requests."""
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.after_idle(self._redraw_idle)
+
+    def _redraw_idle(self):
+        """Perform a redraw scheduled by request_redraw."""
+        self.redraw_pending = False
+        self.draw_pattern()
+
     def draw_pattern(self):
         """Draw the entire pattern on the canvas."""
         self.delete("all")
@@ -128,70 +218,164 @@ class PatternCanvas(tk.Canvas):
         # Draw grid
         self.draw_grid()
 
-        # Draw pattern commands
-        last_x, last_y = 0, 0
+        # Draw pattern commands, transforming with the view held in locals
+        scale, offset_x, offset_y = self.scale, self.offset_x, self.offset_y
+        colors = self.colors
+        last_canvas_x, last_canvas_y = offset_x, offset_y  # World origin
 
-        for i, cmd in enumerate(self.pattern_commands):
-            if cmd.command_type in [CommandType.POINT, CommandType.LINEAR_MOVE, CommandType.CIRCULAR]:
-                canvas_x, canvas_y = self.world_to_canvas(cmd.x, cmd.y)
+        # Items entirely outside the viewport are not created
+        canvas_width = self.winfo_width() or 800
+        canvas_height = self.winfo_height() or 600
+        self.culled = False
+
+        # (color, size) of each drawable type
+        styles = {command_type: (colors[command_type], size)
+                  for command_type, size in _POINT_SIZES.items()}
+
+        # Consecutive visible moves are collected and drawn as one polyline,
+        # remembering which command each vertex belongs to
+        self.line_vertices = {}
+        move_points = []
+        move_indices = []
+        first_move_oval = None
+        last_index = None  # Origin
 
-                # Draw line from last position if it's a movement
-                if cmd.command_type == CommandType.LINEAR_MOVE and i > 0:
-                    last_canvas_x, last_canvas_y = self.world_to_canvas(last_x, last_y)
-                    self.create_line(last_canvas_x, last_canvas_y, canvas_x, canvas_y,
-                                   fill=self.colors[cmd.command_type], width=1, tags="pattern")
+        for i, cmd in enumerate(self.pattern_commands):
+            command_type = cmd.command_type
+            style = styles.get(command_type)
+            if style:
+                color, size = style
+                canvas_x = cmd.x * scale + offset_x
+                canvas_y = cmd.y * scale + offset_y
+
+                # Extend the line from last position if it's a movement,
+                # unless both ends lie beyond the same edge of the viewport
+                if command_type is CommandType.LINEAR_MOVE and i > 0:
+                    if ((canvas_x < -1 and last_canvas_x < -1) or
+                            (canvas_x > canvas_width + 1 and last_canvas_x > canvas_width + 1) or
+                            (canvas_y < -1 and last_canvas_y < -1) or
+                            (canvas_y > canvas_height + 1 and last_canvas_y > canvas_height + 1)):
+                        self.culled = True
+                        if move_points:
+                            self.draw_move_run(move_points, move_indices, first_move_oval)
+                            move_points = []
+                            move_indices = []
+                            first_move_oval = None
+                    else:
+                        if not move_points:
+                            move_points.extend((last_canvas_x, last_canvas_y))
+                            move_indices.append(last_index)
+                        move_points.extend((canvas_x, canvas_y))
+                        move_indices.append(i)
+                elif move_points:
+                    self.draw_move_run(move_points, move_indices, first_move_oval)
+                    move_points = []
+                    move_indices = []
+                    first_move_oval = None
 
                 # Draw point
-                size = 3 if cmd.command_type == CommandType.POINT else 2
-                color = self.colors[cmd.command_type]
+                reach = size + 1  # Radius plus outline
+                if (-reach <= canvas_x <= canvas_width + reach and
+                        -reach <= canvas_y <= canvas_height + reach):
+                    oval = self.create_oval(canvas_x - size, canvas_y - size,
+                                          canvas_x + size, canvas_y + size,
+                                          fill=color, outline=color, tags=f"point_{i}")
+                    if move_points and first_move_oval is None:
+                        first_move_oval = oval
+                else:
+                    self.culled = True
+
+                last_canvas_x, last_canvas_y = canvas_x, canvas_y
+                last_index = i
+
+        if move_points:
+            self.draw_move_run(move_points, move_indices, first_move_oval)
+
+    def draw_move_run(self, points: List[float], indices: List[Optional[int]],
+                      first_oval: Optional[int]):
+        """Draw a run of linear moves as a single polyline beneath its points.
+
+        indices gives the command index of each vertex (None for the origin).
+        """
+        line = self.create_line(points, fill=self.colors[CommandType.LINEAR_MOVE],
+                                width=1, tags="pattern")
+        if first_oval is not None:
+            self.tag_lower(line, first_oval)
+        for vertex, index in enumerate(indices):
+            self.line_vertices[index] = (line, vertex)
+
+    def move_point_items(self, index: int):
+        """Move the drawn dot and line vertex of a command to its current position."""
+        cmd = self.pattern_commands[index]
+        size = _POINT_SIZES.get(cmd.command_type)
+        if size is None:
+            return
 
-                self.create_oval(canvas_x - size, canvas_y - size,
-                               canvas_x + size, canvas_y + size,
-                               fill=color, outline=color, tags=f"point_{i}")
+        canvas_x, canvas_y = self.world_to_canvas(cmd.x, cmd.y)
+        self.coords(f"point_{index}", canvas_x - size, canvas_y - size,
+                    canvas_x + size, canvas_y + size)
 
-                last_x, last_y = cmd.x, cmd.y
+        if index in self.line_vertices:
+            line, vertex = self.line_vertices[index]
+            points = self.coords(line)
+            points[2 * vertex:2 * vertex + 2] = canvas_x, canvas_y
+            self.coords(line, points)
 
     def draw_grid(self):
         """Draw a background grid."""
         canvas_width = self.winfo_width() or 800
         canvas_height = self.winfo_height() or 600
+        scale, offset_x, offset_y = self.scale, self.offset_x, self.offset_y
 
         # Calculate grid spacing in world units
         grid_spacing_world = 1000  # Base grid spacing
-        while grid_spacing_world * self.scale < 20:  # Minimum 20 pixels
+        while grid_spacing_world * scale < 20:  # Minimum 20 pixels
             grid_spacing_world *= 2
-        while grid_spacing_world * self.scale > 100:  # Maximum 100 pixels
+        while grid_spacing_world * scale > 100:  # Maximum 100 pixels
             grid_spacing_world /= 2
 
+        # Each axis is drawn as one zig-zag polyline; the runs joining
+        # neighbouring gridlines lie just outside the visible area
+        grid_options = {"fill": "#E0E0E0", "width": 1, "tags": "grid"}
+
         # Draw vertical lines
-        min_x = (0 - self.offset_x) / self.scale
-        max_x = (canvas_width - self.offset_x) / self.scale
+        min_x = (0 - offset_x) / scale
+        max_x = (canvas_width - offset_x) / scale
 
         start_x = int(min_x / grid_spacing_world) * grid_spacing_world
+        near, far = -1, canvas_height + 1
+        points = []
         x = start_x
         while x <= max_x:
-            canvas_x, _ = self.world_to_canvas(x, 0)
-            self.create_line(canvas_x, 0, canvas_x, canvas_height,
-                           fill="#E0E0E0", width=1, tags="grid")
+            canvas_x = x * scale + offset_x
+            points.extend((canvas_x, near, canvas_x, far))
+            near, far = far, near
             x += grid_spacing_world
+        if points:
+            self.create_line(points, **grid_options)
 
         # Draw horizontal lines
-        min_y = (0 - self.offset_y) / self.scale
-        max_y = (canvas_height - self.offset_y) / self.scale
+        min_y = (0 - offset_y) / scale
+        max_y = (canvas_height - offset_y) / scale
 
         start_y = int(min_y / grid_spacing_world) * grid_spacing_world
+        near, far = -1, canvas_width + 1
+        points = []
         y = start_y
         while y <= max_y:
-            _, canvas_y = self.world_to_canvas(0, y)
-            self.create_line(0, canvas_y, canvas_width, canvas_y,
-                           fill="#E0E0E0", width=1, tags="grid")
+            canvas_y = y * scale + offset_y
+            points.extend((near, canvas_y, far, canvas_y))
+            near, far = far, near
             y += grid_spacing_world
+        if points:
+            self.create_line(points, **grid_options)
 
     def on_click(self, event):
         """Handle mouse click events."""
         self.focus_set()
         self.last_mouse_x = event.x
         self.last_mouse_y = event.y
+        self.point_dragged = False
 
         # Check if clicking on a point
         item = self.find_closest(event.x, event.y)[0]
@@ -215,20 +399,40 @@ class PatternCanvas(tk.Canvas):
             self.offset_y += dy
             self.last_mouse_x = event.x
             self.last_mouse_y = event.y
-            self.draw_pattern()
+
+            # Items skipped as off-screen may now come into view
+            if self.culled:
+                self.request_redraw()
+                return
+
+            # Shift the existing items rather than rebuilding them; only the
+            # grid, which has to keep covering the viewport, is redrawn
+            self.move(tk.ALL, dx, dy)
+            self.delete("grid")
+            if self.pattern_commands:
+                self.draw_grid()
+                self.tag_lower("grid")
         elif self.selected_point is not None:
             # Move selected point
             world_x, world_y = self.canvas_to_world(event.x, event.y)
             cmd = self.pattern_commands[self.selected_point]
             cmd.x = int(world_x)
             cmd.y = int(world_y)
-            self.draw_pattern()
-            self.parent.on_pattern_modified()
+            # Only this command's dot and line vertex need updating
+            self.move_point_items(self.selected_point)
+            self.point_dragged = True
+            self.parent.on_pattern_modified(self.selected_point, self.selected_point + 1)
 
     def on_release(self, event):
         """Handle mouse release events."""
         self.dragging = False
 
+        # A point dragged in from beyond the viewport may have lost its line
+        # segments to culling, so rebuild the view once the drag is over
+        if self.point_dragged and self.culled:
+            self.request_redraw()
+        self.point_dragged = False
+
     def on_zoom(self, event):
         """Handle zoom events."""
         # Get mouse position in world coordinates before zoom
@@ -248,7 +452,76 @@ class PatternCanvas(tk.Canvas):
         self.offset_x += event.x - new_mouse_canvas_x
         self.offset_y += event.y - new_mouse_canvas_y
 
-        self.draw_pattern()
+        self.request_redraw()
+
+
+# Text of the Parser Status and About dialogs
+_PARSER_STATUS_TEXT = """MITSUBISHI PATTERN PARSER STATUS
+
+⚠️ IMPORTANT DISCLAIMER ⚠️
+This parser is based on reverse-engineering and has NOT been validated
+against official Mitsubishi documentation.
+
+VALIDATION FINDINGS:
+✓ Coordinate extraction appears correct (envelope pattern validates as square)
+✓ Function codes from manual found in pattern data
+❌ Command type identification is QUESTIONABLE
+❌ Binary structure interpretation needs verification
+
+CRITICAL ISSUE DISCOVERED:
+The byte sequence 0x03 appears to be coordinate data, NOT command types
+as initially interpreted. This means the parser's command classification
+may be fundamentally incorrect.
+
+WHAT WORKS:
+- Pattern visualization (coordinates seem correct)
+- File loading and basic structure parsing
+- Function code detection
+- Shape analysis (envelope pattern shows correct aspect ratio)
+
+WHAT NEEDS VERIFICATION:
+- All command type identifications (0x61, 0x03, 0xE1, etc.)
+- Parameter decoding for functions
+- Coordinate scaling and units
+- Binary structure interpretation
+
+RECOMMENDATION:
+Create simple test patterns on your sewing machine:
+1. Single stitch at known position
+2. Simple line of stitches
+3. Basic geometric shape
+
+Then compare the parser output with your known input to verify accuracy.
+
+USE AT YOUR OWN RISK for pattern editing until validated!"""
+
+_ABOUT_TEXT = """Mitsubishi PLK-A0804F Pattern Editor
+Version 1.0 (Experimental)
+
+A reverse-engineered pattern parser and editor for Mitsubishi
+PLK-A0804F sewing machine controllers.
+
+⚠️ EXPERIMENTAL SOFTWARE ⚠️
+This software is based on pattern analysis and reverse-engineering.
+The interpretation may be incorrect. Always verify with your machine
+before using edited patterns.
+
+Features:
+• Pattern visualization
+• Basic editing capabilities
+• Export to CSV and G-code
+• Function code detection
+• Validation reporting
+
+Limitations:
+• Command structure not officially verified
+• Coordinate scaling unknown
+• Function parameters may be misinterpreted
+
+For support and updates, check the project documentation.
+
+Developed with Python and Tkinter.
+Not affiliated with Mitsubishi Electric."""
 
 
 class PatternEditorGUI:
@@ -264,9 +537,18 @@ class PatternEditorGUI:
         self.current_file = None
         self.pattern_commands = []
         self.modified = False
+        self.info_refresh_id = None  # Pending after() refresh of the info panels
+        self.last_drawable_index = None  # Where add_point continues from
+        self.pattern_version = 0  # Bumped whenever the commands are loaded or edited
+        self.report_cache = None  # (key, text) of the last validation report
+        self.validation_dialog = None  # Report window, hidden on close and reused
+        self.validation_report_text = None
+        self.report_pool = ThreadPoolExecutor(max_workers=1)  # Builds validation reports
+        self.report_future = None  # Latest report requested from report_pool
 
         self.setup_ui()
         self.setup_menu()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
     def setup_menu(self):
         """Set up the application menu."""
@@ -346,10 +628,10 @@ class PatternEditorGUI:
 
         warning_text = tk.Text(warning_frame, height=4, width=30, font=("Arial", 8),
                               bg="#fff3cd", fg="#856404", wrap=tk.WORD)
-        warning_text.insert(tk.END, "⚠️ EXPERIMENTAL PARSER\n")
-        warning_text.insert(tk.END, "This interpretation is based on reverse-engineering and may be incorrect. ")
-        warning_text.insert(tk.END, "Validation shows command type identification needs verification. ")
-        warning_text.insert(tk.END, "Test with simple known patterns!")
+        warning_text.insert(tk.END, "⚠️ EXPERIMENTAL PARSER\n"
+                            "This interpretation is based on reverse-engineering and may be incorrect. "
+                            "Validation shows command type identification needs verification. "
+                            "Test with simple known patterns!")
         warning_text.config(state=tk.DISABLED)
         warning_text.pack(fill=tk.X, padx=2, pady=2)
 
@@ -517,24 +799,20 @@ class PatternEditorGUI:
             f.write("G90 ; Absolute positioning\n")
             f.write("G21 ; Units in millimeters\n\n")
 
+            lines = []
             for cmd in self.pattern_commands:
-                if cmd.command_type == CommandType.POINT:
-                    x_mm = cmd.x / 100.0
-                    y_mm = cmd.y / 100.0
-                    f.write(f"G1 X{x_mm:.2f} Y{y_mm:.2f} ; Stitch\n")
-                elif cmd.command_type == CommandType.LINEAR_MOVE:
-                    x_mm = cmd.x / 100.0
-                    y_mm = cmd.y / 100.0
-                    f.write(f"G0 X{x_mm:.2f} Y{y_mm:.2f} ; Move\n")
-                elif cmd.command_type == CommandType.CIRCULAR:
-                    x_mm = cmd.x / 100.0
-                    y_mm = cmd.y / 100.0
-                    f.write(f"G2 X{x_mm:.2f} Y{y_mm:.2f} ; Circular\n")
+                template = _GCODE_TEMPLATES.get(cmd.command_type)
+                if template:
+                    lines.append(template.format(cmd.x / 100.0, cmd.y / 100.0))
+            f.write("".join(lines))
 
             f.write("\nM30 ; End of program\n")
 
     def update_display(self):
         """Update all display elements."""
+        self.pattern_version += 1
+        self.last_drawable_index = _last_drawable_index(self.pattern_commands)
+
         # Update canvas
         self.canvas.load_pattern(self.pattern_commands)
 
@@ -553,8 +831,8 @@ class PatternEditorGUI:
             self.update_validation_panel()
             return
 
-        # Calculate statistics
-        analysis = self.parser.analyze_pattern_motion(self.current_file or "temp")
+        # Calculate statistics from the commands being edited
+        analysis = self.parser.analyze_commands(self.pattern_commands)
 
         info = f"File: {os.path.basename(self.current_file) if self.current_file else 'New Pattern'}\n"
         info += f"Commands: {len(self.pattern_commands)}\n"
@@ -595,14 +873,8 @@ class PatternEditorGUI:
             validation_info += f"⚠️ {len(func_commands)} function commands found\n"
 
         # Check coordinate reasonableness
-        coords = []
-        for cmd in self.pattern_commands:
-            if hasattr(cmd, 'x') and hasattr(cmd, 'y') and cmd.x is not None:
-                coords.append((cmd.x, cmd.y))
-
-        if coords:
-            x_coords = [x for x, y in coords]
-            y_coords = [y for x, y in coords]
+        x_coords, y_coords = _position_columns(self.pattern_commands)
+        if x_coords:
             max_coord = max(max(x_coords), max(y_coords))
 
             if max_coord > 50000:
@@ -617,18 +889,30 @@ class PatternEditorGUI:
 
         self.validation_text.insert(tk.END, validation_info)
 
-    def update_command_list(self):
-        """Update the command list display."""
-        self.cmd_listbox.delete(0, tk.END)
-
-        for i, cmd in enumerate(self.pattern_commands):
-            if cmd.command_type in [CommandType.POINT, CommandType.LINEAR_MOVE, CommandType.CIRCULAR]:
-                text = f"{i:3d}: {cmd.command_type.name:12s} ({cmd.x:5d}, {cmd.y:5d})"
+    def update_command_list(self, start: int = 0, stop: Optional[int] = None):
+        """Update the command list display, optionally only rows start to stop."""
+        commands = self.pattern_commands
+        if stop is None:
+            stop = len(commands)
+            self.cmd_listbox.delete(start, tk.END)
+        else:
+            self.cmd_listbox.delete(start, stop - 1)
+
+        format_position_row = _POSITION_ROW.format
+        rows = []
+        for i in range(start, stop):
+            cmd = commands[i]
+            command_type = cmd.command_type
+            label = _TYPE_LABELS[command_type]
+            if command_type in _DRAWABLE_TYPES:
+                text = format_position_row(i, label, cmd.x, cmd.y)
             else:
                 params = ','.join(map(str, cmd.parameters)) if cmd.parameters else ""
-                text = f"{i:3d}: {cmd.command_type.name:12s} {params}"
+                text = f"{i:3d}: {label} {params}"
+            rows.append(text)
 
-            self.cmd_listbox.insert(tk.END, text)
+        if rows:
+            self.cmd_listbox.insert(start, *rows)
 
     def on_command_selected(self, event):
         """Handle command selection in the listbox."""
@@ -636,7 +920,7 @@ class PatternEditorGUI:
         if selection:
             index = selection[0]
             self.canvas.selected_point = index
-            self.canvas.draw_pattern()
+            self.canvas.request_redraw()
 
     def on_point_selected(self, point_index):
         """Handle point selection in the canvas."""
@@ -644,61 +928,72 @@ class PatternEditorGUI:
         self.cmd_listbox.selection_set(point_index)
         self.cmd_listbox.see(point_index)
 
-    def on_pattern_modified(self):
-        """Handle pattern modification."""
+    def on_pattern_modified(self, start: int = 0, stop: Optional[int] = None):
+        """Handle pattern modification of the commands from start to stop."""
         self.modified = True
+        self.pattern_version += 1
+        self.schedule_info_refresh()
+        self.update_command_list(start, stop)
+
+    def schedule_info_refresh(self):
+        """Refresh the information panels once edits pause for 200 ms."""
+        if self.info_refresh_id is not None:
+            self.root.after_cancel(self.info_refresh_id)
+        self.info_refresh_id = self.root.after(200, self._refresh_info_idle)
+
+    def _refresh_info_idle(self):
+        """Perform a refresh scheduled by schedule_info_refresh."""
+        self.info_refresh_id = None
         self.update_info_panel()
-        self.update_command_list()
 
     def add_point(self):
         """Add a new stitch point."""
-        if not self.pattern_commands:
+        if self.last_drawable_index is None:
             # Create first point at origin
             new_cmd = PatternCommand(CommandType.POINT, x=0, y=0)
         else:
             # Add point near the last point
-            last_cmd = None
-            for cmd in reversed(self.pattern_commands):
-                if cmd.command_type in [CommandType.POINT, CommandType.LINEAR_MOVE, CommandType.CIRCULAR]:
-                    last_cmd = cmd
-                    break
-
-            if last_cmd:
-                new_cmd = PatternCommand(CommandType.POINT, x=last_cmd.x + 100, y=last_cmd.y + 100)
-            else:
-                new_cmd = PatternCommand(CommandType.POINT, x=0, y=0)
+            last_cmd = self.pattern_commands[self.last_drawable_index]
+            new_cmd = PatternCommand(CommandType.POINT, x=last_cmd.x + 100, y=last_cmd.y + 100)
 
         # Rebuild raw data for the new command
-        import struct
-        new_cmd.raw_data = struct.pack('<BHH', 0x61, new_cmd.x & 0xFF, new_cmd.y)
+        new_cmd.raw_data = _POINT_STRUCT.pack(0x61, new_cmd.x & 0xFF, new_cmd.y)
 
         self.pattern_commands.append(new_cmd)
-        self.on_pattern_modified()
-        self.canvas.draw_pattern()
+        self.last_drawable_index = len(self.pattern_commands) - 1
+        self.on_pattern_modified(self.last_drawable_index)
+        self.canvas.request_redraw()
 
     def delete_selected(self):
         """Delete the selected command."""
         if self.canvas.selected_point is not None:
             if 0 <= self.canvas.selected_point < len(self.pattern_commands):
-                del self.pattern_commands[self.canvas.selected_point]
+                index = self.canvas.selected_point
+                del self.pattern_commands[index]
+                if self.last_drawable_index is not None:
+                    if index == self.last_drawable_index:
+                        self.last_drawable_index = _last_drawable_index(self.pattern_commands, index)
+                    elif index < self.last_drawable_index:
+                        self.last_drawable_index -= 1
                 self.canvas.selected_point = None
-                self.on_pattern_modified()
-                self.canvas.draw_pattern()
+                # Rows after the deleted one are renumbered
+                self.on_pattern_modified(index)
+                self.canvas.request_redraw()
 
     def fit_to_window(self):
         """Fit the pattern to the window."""
         self.canvas.fit_to_window()
-        self.canvas.draw_pattern()
+        self.canvas.request_redraw()
 
     def zoom_in(self):
         """Zoom in on the pattern."""
         self.canvas.scale *= 1.2
-        self.canvas.draw_pattern()
+        self.canvas.request_redraw()
 
     def zoom_out(self):
         """Zoom out from the pattern."""
         self.canvas.scale /= 1.2
-        self.canvas.draw_pattern()
+        self.canvas.request_redraw()
 
     def validate_pattern(self):
         """Run comprehensive pattern validation."""
@@ -706,161 +1001,159 @@ class PatternEditorGUI:
             messagebox.showwarning("Warning", "No pattern loaded to validate!")
             return
 
-        # Create validation report
-        report = "PATTERN VALIDATION REPORT\n"
-        report += "=" * 40 + "\n\n"
+        # Reuse the last report while neither the file nor the pattern changed
+        try:
+            stat = os.stat(self.current_file) if self.current_file else None
+        except OSError:
+            stat = None
+        cache_key = (self.current_file, stat and (stat.st_mtime_ns, stat.st_size),
+                     self.pattern_version)
+        if self.report_cache and self.report_cache[0] == cache_key:
+            self.report_future = None
+            self.show_validation_report(self.report_cache[1])
+            return
+
+        # Build the report off the Tk thread from a snapshot of the command
+        # list; the main loop polls for the result so Tk is only used there
+        self.show_validation_report("Generating validation report...")
+        future = self.report_pool.submit(self.build_validation_report, self.current_file,
+                                         list(self.pattern_commands))
+        self.report_future = future
+        self.root.after(50, self.poll_validation_report, cache_key, future)
+
+    def poll_validation_report(self, cache_key, future):
+        """Cache a finished validation report and show it if it is still wanted."""
+        if not future.done():
+            self.root.after(50, self.poll_validation_report, cache_key, future)
+            return
+
+        try:
+            report = future.result()
+        except Exception as e:
+            report = f"Validation failed: {e}"
+        else:
+            self.report_cache = (cache_key, report)
+
+        if future is self.report_future:
+            self.report_future = None
+            self.show_validation_report(report)
+
+    def show_validation_report(self, report: str):
+        """Show report text in the validation dialog."""
+        # Built on first use and only hidden on close
+        dialog = self.validation_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self.validation_dialog = tk.Toplevel(self.root)
+            dialog.title("Pattern Validation Report")
+            dialog.geometry("600x500")
+            dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+
+            self.validation_report_text = scrolledtext.ScrolledText(dialog, font=("Courier", 10))
+            self.validation_report_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+            close_btn = ttk.Button(dialog, text="Close", command=dialog.withdraw)
+            close_btn.pack(pady=5)
+
+        text_widget = self.validation_report_text
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete('1.0', tk.END)
+        text_widget.insert(tk.END, report)
+        text_widget.config(state=tk.DISABLED)
+        dialog.deiconify()
+        dialog.lift()
+
+    def build_validation_report(self, filepath: Optional[str],
+                                commands: List[PatternCommand]) -> str:
+        """Build the text of the validation report for commands loaded from filepath."""
+        parts = ["PATTERN VALIDATION REPORT\n"]
+        parts.append("=" * 40 + "\n\n")
 
-        filename = os.path.basename(self.current_file) if self.current_file else "Unknown"
-        report += f"File: {filename}\n"
-        report += f"Commands: {len(self.pattern_commands)}\n\n"
+        filename = os.path.basename(filepath) if filepath else "Unknown"
+        parts.append(f"File: {filename}\n")
+        parts.append(f"Commands: {len(commands)}\n\n")
+
+        # Position extremes shared by the envelope and coordinate checks
+        x_coords, y_coords = _position_columns(commands)
+        if x_coords:
+            min_x, min_y, max_x, max_y = _extents(x_coords, y_coords)
 
         # Check for known patterns
         if "2020KUV" in filename:
-            report += "ENVELOPE PATTERN VALIDATION:\n"
-            coords = []
-            for cmd in self.pattern_commands:
-                if hasattr(cmd, 'x') and hasattr(cmd, 'y') and cmd.x is not None:
-                    coords.append((cmd.x, cmd.y))
-
-            if coords:
-                x_coords = [x for x, y in coords]
-                y_coords = [y for x, y in coords]
-                width = max(x_coords) - min(x_coords)
-                height = max(y_coords) - min(y_coords)
+            parts.append("ENVELOPE PATTERN VALIDATION:\n")
+            if x_coords:
+                width = max_x - min_x
+                height = max_y - min_y
                 aspect_ratio = width / height if height > 0 else 0
 
-                report += f"  Aspect ratio: {aspect_ratio:.3f}\n"
+                parts.append(f"  Aspect ratio: {aspect_ratio:.3f}\n")
                 if 0.8 <= aspect_ratio <= 1.2:
-                    report += "  ✓ Square shape confirmed\n"
+                    parts.append("  ✓ Square shape confirmed\n")
                 else:
-                    report += "  ❌ Not square - parsing error?\n"
+                    parts.append("  ❌ Not square - parsing error?\n")
 
         # Function code analysis
-        report += "\nFUNCTION CODE ANALYSIS:\n"
-        if self.current_file:
+        parts.append("\nFUNCTION CODE ANALYSIS:\n")
+        if filepath:
             try:
-                with open(self.current_file, 'rb') as f:
-                    data = f.read()
-
-                manual_codes = {
-                    0x0002: "Thread Trimming",
-                    0x0003: "Feed",
-                    0x0004: "HALT",
-                    0x0005: "Reverse Rotation",
-                    0x0006: "Second Home Position",
-                    0x0007: "Basting",
-                    0x0031: "END Data"
-                }
-
                 found_codes = []
-                for code, name in manual_codes.items():
-                    import struct
-                    le_bytes = struct.pack('<H', code)
-                    if le_bytes in data:
-                        pos = data.find(le_bytes)
-                        found_codes.append(f"  Found {name} at byte {pos}")
+                with open(filepath, 'rb') as f:
+                    # Search a read-only mapping of the file instead of a copy
+                    # of it; empty files cannot be mapped
+                    if os.fstat(f.fileno()).st_size:
+                        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    else:
+                        mapping = nullcontext(b"")
+
+                    with mapping as data:
+                        for le_bytes, name in _MANUAL_CODE_BYTES.items():
+                            pos = data.find(le_bytes)
+                            if pos >= 0:
+                                found_codes.append(f"  Found {name} at byte {pos}")
 
                 if found_codes:
-                    report += "\n".join(found_codes) + "\n"
+                    parts.append("\n".join(found_codes) + "\n")
                 else:
-                    report += "  No manual function codes found\n"
+                    parts.append("  No manual function codes found\n")
 
             except Exception as e:
-                report += f"  Error reading file: {e}\n"
+                parts.append(f"  Error reading file: {e}\n")
 
         # Coordinate analysis
-        report += "\nCOORDINATE ANALYSIS:\n"
-        coords = []
-        for cmd in self.pattern_commands:
-            if hasattr(cmd, 'x') and hasattr(cmd, 'y') and cmd.x is not None:
-                coords.append((cmd.x, cmd.y))
-
-        if coords:
-            x_coords = [x for x, y in coords]
-            y_coords = [y for x, y in coords]
-            report += f"  X range: {min(x_coords)} to {max(x_coords)}\n"
-            report += f"  Y range: {min(y_coords)} to {max(y_coords)}\n"
+        parts.append("\nCOORDINATE ANALYSIS:\n")
+        if x_coords:
+            parts.append(f"  X range: {min_x} to {max_x}\n")
+            parts.append(f"  Y range: {min_y} to {max_y}\n")
 
-            max_coord = max(max(x_coords), max(y_coords))
+            max_coord = max(max_x, max_y)
             if max_coord > 100000:
-                report += "  ⚠️ Extremely large coordinates - check scaling\n"
+                parts.append("  ⚠️ Extremely large coordinates - check scaling\n")
             elif max_coord > 50000:
-                report += "  ⚠️ Large coordinates detected\n"
+                parts.append("  ⚠️ Large coordinates detected\n")
             else:
-                report += "  ✓ Reasonable coordinate range\n"
+                parts.append("  ✓ Reasonable coordinate range\n")
 
         # Parser confidence
-        report += "\nPARSER CONFIDENCE ASSESSMENT:\n"
-        report += "✓ HIGH: Coordinate extraction (validated with envelope)\n"
-        report += "❓ LOW:  Command type identification (0x03 = coordinates, not commands)\n"
-        report += "❓ MED:  Function code detection (manual codes found in data)\n"
-        report += "❌ UNKNOWN: Real command structure\n\n"
-
-        report += "RECOMMENDATION:\n"
-        report += "Create simple test patterns on your machine and compare\n"
-        report += "with parser output to verify interpretation accuracy."
+        parts.append("\nPARSER CONFIDENCE ASSESSMENT:\n")
+        parts.append("✓ HIGH: Coordinate extraction (validated with envelope)\n")
+        parts.append("❓ LOW:  Command type identification (0x03 = coordinates, not commands)\n")
+        parts.append("❓ MED:  Function code detection (manual codes found in data)\n")
+        parts.append("❌ UNKNOWN: Real command structure\n\n")
 
-        # Show report in a dialog
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Pattern Validation Report")
-        dialog.geometry("600x500")
+        parts.append("RECOMMENDATION:\n")
+        parts.append("Create simple test patterns on your machine and compare\n")
+        parts.append("with parser output to verify interpretation accuracy.")
 
-        text_widget = scrolledtext.ScrolledText(dialog, font=("Courier", 10))
-        text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        text_widget.insert(tk.END, report)
-        text_widget.config(state=tk.DISABLED)
-
-        close_btn = ttk.Button(dialog, text="Close", command=dialog.destroy)
-        close_btn.pack(pady=5)
+        return "".join(parts)
 
     def show_parser_status(self):
         """Show detailed parser status and limitations."""
-        status_text = """MITSUBISHI PATTERN PARSER STATUS
-
-⚠️ IMPORTANT DISCLAIMER ⚠️
-This parser is based on reverse-engineering and has NOT been validated
-against official Mitsubishi documentation.
-
-VALIDATION FINDINGS:
-✓ Coordinate extraction appears correct (envelope pattern validates as square)
-✓ Function codes from manual found in pattern data
-❌ Command type identification is QUESTIONABLE
-❌ Binary structure interpretation needs verification
-
-CRITICAL ISSUE DISCOVERED:
-The byte sequence 0x03 appears to be coordinate data, NOT command types
-as initially interpreted. This means the parser's command classification
-may be fundamentally incorrect.
-
-WHAT WORKS:
-- Pattern visualization (coordinates seem correct)
-- File loading and basic structure parsing
-- Function code detection
-- Shape analysis (envelope pattern shows correct aspect ratio)
-
-WHAT NEEDS VERIFICATION:
-- All command type identifications (0x61, 0x03, 0xE1, etc.)
-- Parameter decoding for functions
-- Coordinate scaling and units
-- Binary structure interpretation
-
-RECOMMENDATION:
-Create simple test patterns on your sewing machine:
-1. Single stitch at known position
-2. Simple line of stitches
-3. Basic geometric shape
-
-Then compare the parser output with your known input to verify accuracy.
-
-USE AT YOUR OWN RISK for pattern editing until validated!"""
-
         dialog = tk.Toplevel(self.root)
         dialog.title("Parser Status & Limitations")
         dialog.geometry("700x600")
 
         text_widget = scrolledtext.ScrolledText(dialog, font=("Arial", 10), wrap=tk.WORD)
         text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        text_widget.insert(tk.END, status_text)
+        text_widget.insert(tk.END, _PARSER_STATUS_TEXT)
         text_widget.config(state=tk.DISABLED)
 
         close_btn = ttk.Button(dialog, text="Close", command=dialog.destroy)
@@ -868,40 +1161,17 @@ USE AT YOUR OWN RISK for pattern editing until validated!"""
 
     def show_about(self):
         """Show about dialog."""
-        about_text = """Mitsubishi PLK-A0804F Pattern Editor
-Version 1.0 (Experimental)
-
-A reverse-engineered pattern parser and editor for Mitsubishi
-PLK-A0804F sewing machine controllers.
-
-⚠️ EXPERIMENTAL SOFTWARE ⚠️
-This software is based on pattern analysis and reverse-engineering.
-The interpretation may be incorrect. Always verify with your machine
-before using edited patterns.
-
-Features:
-• Pattern visualization
-• Basic editing capabilities
-• Export to CSV and G-code
-• Function code detection
-• Validation reporting
-
-Limitations:
-• Command structure not officially verified
-• Coordinate scaling unknown
-• Function parameters may be misinterpreted
-
-For support and updates, check the project documentation.
-
-Developed with Python and Tkinter.
-Not affiliated with Mitsubishi Electric."""
-
-        messagebox.showinfo("About Pattern Editor", about_text)
+        messagebox.showinfo("About Pattern Editor", _ABOUT_TEXT)
 
     def refresh_display(self):
         """Refresh the display."""
         self.update_display()
 
+    def on_closing(self):
+        """Stop background work and close the main window."""
+        self.report_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def run(self):
         """Start the GUI application."""
         # Load a sample pattern if available
@@ -919,6 +1189,7 @@ Not affiliated with Mitsubishi Electric."""
                     continue
 
         self.root.mainloop()
+        self.report_pool.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
@@ -749,9 +749,6 @@ class Pattern100ViewerGUI:
             return self.save_pattern_as()
 
         try:
-            # Reset save position for delta calculation
-            self.parser._last_save_x = 0
-            self.parser._last_save_y = 0
             self.parser.commands = self.pattern_commands
             self.parser.save_to_file(self.current_file)
             self.modified = False
@@ -784,9 +781,6 @@ class Pattern100ViewerGUI:
 
         if filename:
             try:
-                # Reset save position for delta calculation
-                self.parser._last_save_x = 0
-                self.parser._last_save_y = 0
                 self.parser.commands = self.pattern_commands
                 self.parser.save_to_file(filename)
                 self.current_file = filename
@@ -3,6 +3,7 @@
 Test script to verify pattern saving works correctly
 """
 
+import sys
 from mitsubishi_100_parser import Mitsubishi100Parser, CommandType
 
 def test_save():
@@ -40,6 +41,18 @@ def test_save():
             else:
                 print(f"  {i}: {cmd.command_type.value}")
 
+        # Saving the same pattern again should produce the same file
+        with open(test_filename, 'rb') as f:
+            first_save = f.read()
+        parser.save_to_file(test_filename)
+        with open(test_filename, 'rb') as f:
+            second_save = f.read()
+        identical = first_save == second_save
+        print(f"Repeated save identical: {identical}")
+        if not identical:
+            # SystemExit is not caught below, so the script fails
+            sys.exit(1)
+
     except Exception as e:
         print(f"Error: {e}")
 